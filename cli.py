@@ -42,6 +42,19 @@ EMOTION_COLORS = {
     "neutral":   C.CYAN,
 }
 
+# Every possible 20-cell bar, built once at import
+_BAR_WIDTH = 20
+_INTENSITY_BARS = tuple(
+    f"[{'█' * i}{'░' * (_BAR_WIDTH - i)}]" for i in range(_BAR_WIDTH + 1)
+)
+_SCORE_BARS = tuple("█" * i for i in range(_BAR_WIDTH + 1))
+
+# Pre-coloured "PRIMARY EMOTION" labels
+_PRIMARY_LABELS = {
+    name: f"{color}{C.BOLD}{name.upper()}{C.END}"
+    for name, color in EMOTION_COLORS.items()
+}
+
 
 def print_banner():
     print(f"""
@@ -61,7 +74,9 @@ def print_result(result: dict):
     print(f"   \"{emotion['text']}\"\n")
 
     print(f"{C.BOLD}🔍 Emotion Analysis:{C.END}")
-    print(f"   Primary Emotion: {color}{C.BOLD}{emotion['primary_emotion'].upper()}{C.END}")
+    primary = emotion["primary_emotion"]
+    primary_label = _PRIMARY_LABELS.get(primary) or f"{color}{C.BOLD}{primary.upper()}{C.END}"
+    print(f"   Primary Emotion: {primary_label}")
     print(f"   Granular Label:  {color}{emotion['granular_label']}{C.END}")
     print(f"   Intensity:       {_intensity_bar(emotion['intensity'])} {emotion['intensity']:.1%}")
 
@@ -77,7 +92,7 @@ def print_result(result: dict):
         print(f"\n   HuggingFace Emotion Scores:")
         sorted_scores = sorted(emotion["hf_scores"].items(), key=lambda x: -x[1])
         for label, score in sorted_scores:
-            bar = "█" * int(score * 20)
+            bar = _SCORE_BARS[_bar_cells(score)]
             highlight = C.BOLD if label == emotion["granular_label"] else ""
             print(f"     {highlight}{label:>10s}: {bar} {score:.3f}{C.END}")
 
@@ -92,9 +107,12 @@ def print_result(result: dict):
     print()
 
 
+def _bar_cells(fraction: float) -> int:
+    return min(_BAR_WIDTH, max(0, int(fraction * _BAR_WIDTH)))
+
+
 def _intensity_bar(intensity: float) -> str:
-    filled = int(intensity * 20)
-    return f"[{'█' * filled}{'░' * (20 - filled)}]"
+    return _INTENSITY_BARS[_bar_cells(intensity)]
 
 
 def main():
@@ -0,0 +1,18 @@
+"""
+Optional Numba JIT
+
+Re-exports ``numba.njit`` when numba is installed; otherwise ``njit`` is a
+no-op decorator so the decorated helpers run as plain Python.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        # Support ``@njit``, ``@njit(cache=True)`` and ``@njit("sig", ...)``
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
@@ -6,19 +6,78 @@ emotion classification for granular, intensity-aware emotion detection.
 """
 
 import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from empathy_engine._numba import njit
 
 # VADER for sentiment scoring
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
 # HuggingFace for granular emotion classification
 try:
-    from transformers import pipeline as hf_pipeline
+    import torch
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
     HF_AVAILABLE = True
 except ImportError:
     HF_AVAILABLE = False
 
+# torch's default intra-op thread count (respects affinity / physical cores),
+# captured once before any detector changes the process-global setting
+_TORCH_BASE_THREADS = torch.get_num_threads() if HF_AVAILABLE else None
+
+# Optional Intel Extension for PyTorch (fused oneDNN BF16 kernels)
+try:
+    import intel_extension_for_pytorch as ipex
+    IPEX_AVAILABLE = True
+except ImportError:
+    IPEX_AVAILABLE = False
+
+# Optional INT8 ONNX Runtime path (much faster CPU inference)
+try:
+    import onnxruntime
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from transformers import AutoTokenizer
+    ORT_AVAILABLE = True
+except ImportError:
+    ORT_AVAILABLE = False
+
+
+HF_MODEL_NAME = "j-hartmann/emotion-english-distilroberta-base"
+
+# Where the quantized ONNX export is cached between runs
+ONNX_CACHE_DIR = Path(
+    os.environ.get(
+        "EMPATHY_ONNX_CACHE",
+        Path.home() / ".cache" / "empathy_engine" / "distilroberta-emotion-int8",
+    )
+)
+ONNX_QUANTIZED_FILE = "model_quantized.onnx"
+
+
+# Shared VADER analyser — its lexicon is parsed once per process, and
+# polarity_scores() is stateless so every detector can reuse it.
+_VADER_SINGLETON: Optional[SentimentIntensityAnalyzer] = None
+
+
+def _get_vader() -> SentimentIntensityAnalyzer:
+    global _VADER_SINGLETON
+    if _VADER_SINGLETON is None:
+        _VADER_SINGLETON = SentimentIntensityAnalyzer()
+    return _VADER_SINGLETON
+
 
 # ---------------------------------------------------------------------------
 # Emotion categories  (must support at least 3 — we support 7+)
@@ -46,15 +105,24 @@ VADER_POLARITY_MAP = {
 }
 
 
-@dataclass
+@dataclass(frozen=True)
 class EmotionResult:
-    """Result of emotion analysis on a piece of text."""
+    """
+    Result of emotion analysis on a piece of text.
+
+    Read-only (the score mappings are MappingProxyType views of private
+    copies), since cached results are shared between callers.
+    """
     text: str
     primary_emotion: str          # e.g. "joy", "anger", "neutral"
     intensity: float              # 0.0 – 1.0
     granular_label: str           # more nuanced label from HF model
-    vader_scores: Dict[str, float] = field(default_factory=dict)
-    hf_scores: Dict[str, float] = field(default_factory=dict)
+    vader_scores: Mapping[str, float] = field(default_factory=dict)
+    hf_scores: Mapping[str, float] = field(default_factory=dict)
+
+    def __post_init__(self):
+        object.__setattr__(self, "vader_scores", MappingProxyType(dict(self.vader_scores)))
+        object.__setattr__(self, "hf_scores", MappingProxyType(dict(self.hf_scores)))
 
     def to_dict(self) -> dict:
         return {
@@ -67,47 +135,191 @@ class EmotionResult:
         }
 
 
+class _BatchRunner:
+    """
+    Micro-batching worker thread.
+
+    Concurrent callers each submit one text; the worker drains up to
+    *max_batch_size* queued texts (waiting at most *max_wait_ms* after the
+    first arrives) and runs them through *batch_fn* as a single padded batch.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[str]], list],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 8.0,
+    ):
+        self._batch_fn = batch_fn
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000.0
+        self._queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="hf-batch-runner", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, text: str):
+        """Queue *text* and block until its batch has been processed."""
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future.result()
+
+    def _run(self):
+        while True:
+            items = [self._queue.get()]
+            deadline = time.monotonic() + self._max_wait
+            while len(items) < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                results = self._batch_fn([text for text, _ in items])
+            except Exception as exc:
+                for _, future in items:
+                    future.set_exception(exc)
+                continue
+
+            for (_, future), result in zip(items, results):
+                future.set_result(result)
+
+
 class EmotionDetector:
     """
     Two-stage emotion detector:
       1. VADER — fast compound / pos / neg / neu scores + intensity
       2. HuggingFace distilroberta — granular emotion labels
-    Falls back to VADER-only mode if transformers is unavailable.
+    Falls back to VADER-only mode if transformers is unavailable. When the
+    HF model is loaded, VADER is skipped unless ``always_vader`` is set.
+
+    When optimum + onnxruntime are installed, the HuggingFace model is
+    exported to ONNX and dynamically quantized to INT8 (cached on disk),
+    then run directly through ONNX Runtime's CPUExecutionProvider.
     """
 
-    def __init__(self, use_hf: bool = True):
+    def __init__(
+        self,
+        use_hf: bool = True,
+        cache_size: int = 1024,
+        batch_window_ms: float = 0.0,
+        max_batch_size: int = 16,
+        bf16: Optional[bool] = None,
+        always_vader: bool = False,
+        static_length: Optional[int] = None,
+    ):
+        """
+        Parameters
+        ----------
+        use_hf : bool
+            Whether to load the HuggingFace emotion classifier.
+        cache_size : int
+            Number of recent texts whose results are memoised (0 disables).
+        batch_window_ms : float
+            If > 0, concurrent HF calls arriving within this window are
+            coalesced into one batch (useful for the threaded web server).
+        max_batch_size : int
+            Upper bound on texts per coalesced batch.
+        bf16 : bool, optional
+            Run the PyTorch model in bfloat16. ``None`` enables it only when
+            the CPU has native BF16 support (AVX512-BF16 / AMX).
+        always_vader : bool
+            Run VADER (and derive intensity from it) even when the HF model
+            is loaded. By default intensity then comes from the HF scores
+            and ``vader_scores`` is left empty.
+        static_length : int, optional
+            "Short mode" for short UI texts: always pad/truncate to exactly
+            this many tokens (e.g. 32), so every call has the same input
+            shape and the PyTorch model can be compiled shape-static (only
+            the batch dimension stays dynamic when micro-batching).
+        """
+        self.always_vader = always_vader
+
+        # Tokenizer settings shared by every forward pass
+        self.static_length = static_length
+        self._batched = batch_window_ms > 0
+        self._mark_batch_dynamic = False
+        if static_length:
+            self._tokenizer_kwargs = dict(
+                truncation=True, padding="max_length", max_length=static_length
+            )
+        else:
+            self._tokenizer_kwargs = dict(truncation=True, padding=True)
+
+        # Repeated texts skip both VADER and the transformer entirely
+        if cache_size > 0:
+            self._detect_cached = lru_cache(maxsize=cache_size)(self._detect_uncached)
+        else:
+            self._detect_cached = self._detect_uncached
+
         # Always initialise VADER
-        self.vader = SentimentIntensityAnalyzer()
+        self.vader = _get_vader()
 
         # Optionally load HuggingFace emotion classifier
         self.hf_classifier = None
-        if use_hf and HF_AVAILABLE:
+        self.hf_session = None       # onnxruntime.InferenceSession (INT8 path)
+        self.hf_tokenizer = None
+        self.hf_labels: Dict[int, str] = {}
+        self.hf_bf16 = False
+        if use_hf and (ORT_AVAILABLE or HF_AVAILABLE):
+            # Suppress symlink warnings on Windows
+            os.environ.setdefault("HF_HUB_DISABLE_SYMLINKS_WARNING", "1")
+
+        if use_hf and ORT_AVAILABLE:
             try:
-                # Suppress symlink warnings on Windows
-                os.environ.setdefault("HF_HUB_DISABLE_SYMLINKS_WARNING", "1")
-                self.hf_classifier = hf_pipeline(
-                    "text-classification",
-                    model="j-hartmann/emotion-english-distilroberta-base",
-                    top_k=None,           # return all labels with scores
-                    truncation=True,
-                )
-                print("✓ HuggingFace emotion model loaded successfully")
+                self._load_onnx_int8()
+                print("✓ HuggingFace emotion model loaded (INT8 ONNX Runtime)")
+            except Exception as exc:
+                print(f"⚠ INT8 ONNX model could not be loaded ({exc}). "
+                      "Trying the PyTorch model instead.")
+                self.hf_classifier = None
+                self.hf_session = None
+
+        if use_hf and HF_AVAILABLE and self.hf_classifier is None:
+            try:
+                self._load_torch(bf16)
+                print("✓ HuggingFace emotion model loaded successfully"
+                      + (" (bfloat16)" if self.hf_bf16 else ""))
             except Exception as exc:
                 print(f"⚠ HuggingFace model could not be loaded ({exc}). "
                       "Falling back to VADER-only mode.")
 
+        self._batcher: Optional[_BatchRunner] = None
+        if self.hf_classifier is not None and batch_window_ms > 0:
+            self._batcher = _BatchRunner(
+                self._hf_analyse_batch,
+                max_batch_size=max_batch_size,
+                max_wait_ms=batch_window_ms,
+            )
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
     def detect(self, text: str) -> EmotionResult:
         """Analyse *text* and return an EmotionResult."""
-        vader_scores = self._vader_analyse(text)
-        intensity = self._compute_intensity(vader_scores)
+        return self._detect_cached(text)
 
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _detect_uncached(self, text: str) -> EmotionResult:
         if self.hf_classifier is not None:
             hf_scores, granular_label = self._hf_analyse(text)
             primary_emotion = HF_LABEL_MAP.get(granular_label, granular_label)
+            if self.always_vader:
+                vader_scores = self._vader_analyse(text)
+                intensity = self._compute_intensity(vader_scores)
+            else:
+                # HF already knows how emotional the text is — skip VADER
+                vader_scores = {}
+                intensity = self._hf_intensity(hf_scores)
         else:
+            vader_scores = self._vader_analyse(text)
+            intensity = self._compute_intensity(vader_scores)
             hf_scores = {}
             polarity = self._vader_polarity(vader_scores)
             primary_emotion = VADER_POLARITY_MAP[polarity]
@@ -122,9 +334,6 @@ class EmotionDetector:
             hf_scores=hf_scores,
         )
 
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
     def _vader_analyse(self, text: str) -> Dict[str, float]:
         return self.vader.polarity_scores(text)
 
@@ -140,11 +349,180 @@ class EmotionDetector:
     @staticmethod
     def _compute_intensity(vader_scores: Dict[str, float]) -> float:
         """Map VADER compound score (−1 … +1) to intensity (0 … 1)."""
-        return min(abs(vader_scores["compound"]) * 1.2, 1.0)
+        return float(_intensity_numba(float(vader_scores["compound"])))
+
+    @staticmethod
+    def _hf_intensity(hf_scores: Dict[str, float]) -> float:
+        """Map HF probability mass away from "neutral" to intensity (0 … 1)."""
+        return min((1.0 - hf_scores.get("neutral", 0.0)) * 1.1, 1.0)
+
+    def _load_onnx_int8(self):
+        """Export the model to ONNX and quantize it to INT8 (once, cached)."""
+        model_path = ONNX_CACHE_DIR / ONNX_QUANTIZED_FILE
+        if not model_path.exists():
+            # Build in a private temp subdir, then os.replace the finished
+            # files into ONNX_CACHE_DIR (config first, model last — the model
+            # file is what marks the cache complete). Other processes never
+            # see a half-written model, a crash leaves at most a stray
+            # .export-* dir, and the user-supplied directory itself is never
+            # renamed or deleted.
+            ONNX_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_dir = Path(tempfile.mkdtemp(prefix=".export-", dir=ONNX_CACHE_DIR))
+            try:
+                fp32_model = ORTModelForSequenceClassification.from_pretrained(
+                    HF_MODEL_NAME, export=True,
+                )
+                quantizer = ORTQuantizer.from_pretrained(fp32_model)
+                # Dynamic INT8 weights + activations for all Linear/MatMul ops
+                qconfig = AutoQuantizationConfig.avx512_vnni(
+                    is_static=False, per_channel=False,
+                )
+                quantizer.quantize(save_dir=tmp_dir, quantization_config=qconfig)
+                fp32_model.config.save_pretrained(tmp_dir)
+
+                os.replace(tmp_dir / "config.json", ONNX_CACHE_DIR / "config.json")
+                os.replace(tmp_dir / ONNX_QUANTIZED_FILE, model_path)
+            finally:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        session_options = onnxruntime.SessionOptions()
+        threads = _inference_threads()
+        if threads is not None:
+            session_options.intra_op_num_threads = threads
+            session_options.inter_op_num_threads = 1
+
+        self.hf_classifier = ORTModelForSequenceClassification.from_pretrained(
+            ONNX_CACHE_DIR,
+            file_name=ONNX_QUANTIZED_FILE,
+            provider="CPUExecutionProvider",
+            session_options=session_options,
+        )
+        self.hf_session = self.hf_classifier.model
+        self.hf_tokenizer = AutoTokenizer.from_pretrained(HF_MODEL_NAME)
+        self.hf_labels = {
+            int(i): label for i, label in self.hf_classifier.config.id2label.items()
+        }
+
+    def _load_torch(self, bf16: Optional[bool] = None):
+        """Load tokenizer + model for direct (pipeline-free) PyTorch inference."""
+        # Divide the import-time default, not the current (possibly already
+        # divided) value, so repeated detectors in one process don't compound
+        threads = _inference_threads(_TORCH_BASE_THREADS)
+        if threads is not None:
+            torch.set_num_threads(threads)
+            try:
+                torch.set_num_interop_threads(1)
+            except RuntimeError:
+                pass  # can only be set once, before any inter-op work has run
+
+        self.hf_tokenizer = AutoTokenizer.from_pretrained(HF_MODEL_NAME)
+        model = AutoModelForSequenceClassification.from_pretrained(
+            HF_MODEL_NAME
+        ).eval()
+
+        self.hf_bf16 = _cpu_supports_bf16() if bf16 is None else bf16
+        if self.hf_bf16:
+            model = model.to(dtype=torch.bfloat16)
+            if IPEX_AVAILABLE:
+                model = ipex.optimize(model, dtype=torch.bfloat16)
+
+        self.hf_labels = {
+            int(i): label for i, label in model.config.id2label.items()
+        }
+        self.hf_classifier = model
+
+        # Fixed sequence length → compile once instead of per input shape.
+        # With micro-batching the batch size still varies, so that one
+        # dimension is marked dynamic rather than recompiling per size.
+        if self.static_length and hasattr(torch, "compile"):
+            try:
+                self.hf_classifier = torch.compile(
+                    model, dynamic=None if self._batched else False
+                )
+                self._mark_batch_dynamic = self._batched
+                # Compile now, not on the first request (batch size 1 is
+                # always specialised, so warm the >1 graph separately)
+                self._hf_logits(["warmup"])
+                if self._batched:
+                    self._hf_logits(["warmup", "warmup"])
+            except Exception as exc:
+                print(f"⚠ torch.compile unavailable ({exc}); using eager model.")
+                self.hf_classifier = model
+                self._mark_batch_dynamic = False
 
     def _hf_analyse(self, text: str):
         """Return (scores_dict, top_label) from HuggingFace model."""
-        results = self.hf_classifier(text)[0]  # list of {label, score}
-        scores = {r["label"]: r["score"] for r in results}
-        top_label = max(scores, key=scores.get)
-        return scores, top_label
+        if self._batcher is not None:
+            return self._batcher.submit(text)
+        return self._hf_analyse_batch([text])[0]
+
+    def _hf_analyse_batch(self, texts: List[str]) -> List[Tuple[Dict[str, float], str]]:
+        """Run one padded batch through the model; one (scores, top_label) per text."""
+        logits = self._hf_logits(texts)
+        top_ids = logits.argmax(axis=1).tolist()  # softmax is monotonic
+        probs = np.exp(logits - logits.max(axis=1, keepdims=True))
+        probs /= probs.sum(axis=1, keepdims=True)
+
+        labels = self.hf_labels
+        return [
+            ({labels[i]: p for i, p in enumerate(row)}, labels[top])
+            for row, top in zip(probs.tolist(), top_ids)
+        ]
+
+    def _hf_logits(self, texts: List[str]) -> np.ndarray:
+        """Return raw logits of shape (len(texts), num_labels)."""
+        if self.hf_session is not None:
+            # Call the ORT session directly
+            enc = self.hf_tokenizer(texts, return_tensors="np", **self._tokenizer_kwargs)
+            input_names = {i.name for i in self.hf_session.get_inputs()}
+            feed = {k: v.astype(np.int64) for k, v in enc.items() if k in input_names}
+            return self.hf_session.run(None, feed)[0]
+
+        enc = self.hf_tokenizer(texts, return_tensors="pt", **self._tokenizer_kwargs)
+        if self._mark_batch_dynamic and len(texts) > 1:
+            for tensor in enc.values():
+                torch._dynamo.mark_dynamic(tensor, 0)
+        with torch.inference_mode(), torch.autocast(
+            "cpu", dtype=torch.bfloat16, enabled=self.hf_bf16
+        ):
+            logits = self.hf_classifier(**enc).logits
+        # NumPy has no bfloat16 — softmax runs in float32
+        return logits.float().numpy()
+
+
+@njit("float64(float64)", cache=True)  # eager compile at import
+def _intensity_numba(compound):
+    return min(abs(compound) * 1.2, 1.0)
+
+
+def _inference_threads(total: Optional[int] = None) -> Optional[int]:
+    """
+    Intra-op threads for model inference when running as one of
+    WEB_CONCURRENCY worker processes: *total* (default: CPUs this process
+    may run on) split evenly, so N gunicorn workers don't each spin up a
+    thread per core and oversubscribe the CPU.
+
+    Returns None — keep the runtime's own default — when WEB_CONCURRENCY
+    isn't set (CLI, dev server).
+    """
+    try:
+        workers = int(os.environ["WEB_CONCURRENCY"])
+    except (KeyError, ValueError):
+        return None
+    if total is None:
+        try:
+            total = len(os.sched_getaffinity(0))
+        except AttributeError:  # not available on macOS / Windows
+            total = os.cpu_count() or 1
+    return max(1, total // max(1, workers))
+
+
+def _cpu_supports_bf16() -> bool:
+    """True if the CPU has native BF16 instructions (AVX512-BF16 or AMX)."""
+    try:
+        return bool(
+            torch.cpu._is_avx512_bf16_supported()
+            or torch.cpu._is_amx_tile_supported()
+        )
+    except AttributeError:  # older torch without the CPU capability probes
+        return False
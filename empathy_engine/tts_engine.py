@@ -10,10 +10,14 @@ Supports multiple backends:
 
 import os
 import sys
+import json
+import hashlib
 import uuid
+import queue
 import subprocess
 import tempfile
 import platform
+import threading
 from pathlib import Path
 
 from empathy_engine.voice_mapper import VoiceParams
@@ -30,6 +34,143 @@ def _is_macos() -> bool:
     return platform.system() == "Darwin"
 
 
+# ---------------------------------------------------------------------------
+# Persistent pyttsx3 worker
+# ---------------------------------------------------------------------------
+# pyttsx3 still runs out-of-process (avoids the macOS runLoop hang), but one
+# long-lived child serves every request over newline-delimited JSON instead
+# of paying interpreter startup + pyttsx3.init() per synthesis.
+_PYTTSX3_WORKER_SCRIPT = r"""
+import json
+import os
+import sys
+
+# Keep stdout for the protocol; route any driver chatter to stderr
+out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+os.dup2(2, 1)
+
+import pyttsx3
+
+engine = pyttsx3.init()
+try:
+    voices = engine.getProperty('voices')
+    if voices:
+        engine.setProperty('voice', voices[0].id)
+except Exception:
+    pass
+
+for line in sys.stdin:
+    try:
+        job = json.loads(line)
+        engine.setProperty('rate', job['rate'])
+        engine.setProperty('volume', job['volume'])
+        engine.save_to_file(job['text'], job['path'])
+        engine.runAndWait()
+        reply = {'ok': True}
+    except Exception as exc:
+        reply = {'ok': False, 'error': str(exc)}
+    out.write(json.dumps(reply) + '\n')
+    out.flush()
+"""
+
+
+class _Pyttsx3Worker:
+    """Long-lived pyttsx3 child process; spawned on first use, restarted on EOF."""
+
+    def __init__(self):
+        self._proc = None
+        self._replies = None
+        self._stderr = None     # temp file holding the child's stderr
+        self._lock = threading.Lock()
+
+    def synthesize(
+        self, text: str, rate: int, volume: float, path: str, timeout: float = 30
+    ) -> None:
+        job = json.dumps(
+            {"text": text, "rate": rate, "volume": volume, "path": path}
+        ) + "\n"
+
+        with self._lock:
+            reply = None
+            stderr = ""
+            for _ in range(2):  # one restart if the worker has died
+                if self._proc is None or self._proc.poll() is not None:
+                    self.close()
+                    self._spawn()
+                else:
+                    # Only this job's output should end up in an error message
+                    self._stderr.seek(0)
+                    self._stderr.truncate()
+                try:
+                    self._proc.stdin.write(job)
+                    self._proc.stdin.flush()
+                except OSError:
+                    stderr = self._read_stderr()
+                    self.close()
+                    continue
+                try:
+                    reply = self._replies.get(timeout=timeout)
+                except queue.Empty:
+                    self.close()
+                    raise subprocess.TimeoutExpired("pyttsx3 worker", timeout)
+                if reply is not None:
+                    break
+                stderr = self._read_stderr()
+                self.close()
+
+        if reply is None:
+            raise RuntimeError(f"pyttsx3 failed: worker process exited\n{stderr}")
+        result = json.loads(reply)
+        if not result.get("ok"):
+            raise RuntimeError(f"pyttsx3 failed: {result.get('error')}")
+
+    def close(self):
+        if self._proc is not None:
+            if self._proc.poll() is None:
+                self._proc.kill()
+            self._proc.wait()
+            self._proc.stdin.close()
+            self._proc = None
+        if self._stderr is not None:
+            self._stderr.close()
+            self._stderr = None
+
+    def _read_stderr(self, limit: int = 4000) -> str:
+        """Return the tail of the child's stderr (e.g. an import traceback)."""
+        if self._proc is not None:
+            try:
+                self._proc.wait(timeout=1)  # let a dying child finish writing
+            except subprocess.TimeoutExpired:
+                pass
+        self._stderr.seek(0)
+        return self._stderr.read()[-limit:].decode("utf-8", "replace").strip()
+
+    def _spawn(self):
+        self._stderr = tempfile.TemporaryFile()
+        self._proc = subprocess.Popen(
+            [sys.executable, "-c", _PYTTSX3_WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._stderr,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        self._replies = queue.Queue()
+        threading.Thread(
+            target=self._read_replies,
+            args=(self._proc, self._replies),
+            name="pyttsx3-reader",
+            daemon=True,
+        ).start()
+
+    @staticmethod
+    def _read_replies(proc, replies):
+        for line in proc.stdout:
+            replies.put(line)
+        replies.put(None)  # EOF — worker exited
+
+
 class TTSEngine:
     """
     Text-to-Speech engine that applies VoiceParams before synthesis.
@@ -37,7 +178,7 @@ class TTSEngine:
     Backends (in reliability order on macOS):
       • macos_say  – macOS native 'say' command (most reliable on Mac)
       • pyttsx3    – cross-platform offline
-      • gtts       – online (Google), with pydub post-processing
+      • gtts       – online (Google), with soundfile/scipy post-processing
     """
 
     def __init__(self, backend: str = "auto"):
@@ -53,6 +194,9 @@ class TTSEngine:
         else:
             self.backend = backend.lower()
 
+        # Spawned lazily on the first pyttsx3 synthesis
+        self._pyttsx3_worker = _Pyttsx3Worker()
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -65,19 +209,68 @@ class TTSEngine:
         """
         Synthesise *text* with the given *params* and save to *output_path*.
         Returns the absolute path to the generated audio file.
+
+        Without an explicit *output_path*, the file name is derived from
+        (backend, text, params), so repeated requests reuse the audio
+        already in OUTPUT_DIR instead of re-synthesising it.
         """
-        if output_path is None:
-            ext = ".mp3" if self.backend == "gtts" else ".wav"
-            output_path = str(OUTPUT_DIR / f"empathy_{uuid.uuid4().hex[:8]}{ext}")
+        # Read once: the web app reassigns self.backend per request while
+        # other request threads are mid-synthesis, and the extension, cache
+        # key and dispatch must all agree on a single backend.
+        backend = self.backend
 
-        if self.backend == "macos_say":
+        if output_path is None:
+            ext = ".mp3" if backend == "gtts" else ".wav"
+            cached = OUTPUT_DIR / f"empathy_{self._cache_key(backend, text, params)}{ext}"
+            # The 'say' backends fall back to publishing AIFF when conversion
+            # to WAV isn't possible, under the same cache stem
+            for candidate in (cached, cached.with_suffix(".aiff")):
+                if candidate.is_file():
+                    return str(candidate.resolve())
+
+            # Synthesise under a unique temp name, then atomically rename it
+            # onto the cache path: concurrent requests never see (or write)
+            # a partial file, and a killed process leaves only a stray temp.
+            tmp_path = cached.with_name(
+                f"{cached.stem}.tmp-{uuid.uuid4().hex[:8]}{ext}"
+            )
+            produced = None
+            try:
+                produced = self._synthesize_backend(
+                    backend, text, params, str(tmp_path)
+                )
+                # Backends may change the extension (e.g. AIFF fallback)
+                final = cached.with_suffix(Path(produced).suffix)
+                os.replace(produced, final)
+                return str(final.resolve())
+            except Exception:
+                for leftover in {str(tmp_path), produced}:
+                    if leftover and os.path.exists(leftover):
+                        try:
+                            os.remove(leftover)
+                        except OSError:
+                            pass
+                raise
+
+        return self._synthesize_backend(backend, text, params, output_path)
+
+    @staticmethod
+    def _cache_key(backend: str, text: str, params: VoiceParams) -> str:
+        key = (f"{backend}|{text}|{params.rate}|"
+               f"{params.pitch:.3f}|{params.volume:.3f}")
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+
+    def _synthesize_backend(
+        self, backend: str, text: str, params: VoiceParams, output_path: str
+    ) -> str:
+        if backend == "macos_say":
             return self._synthesize_macos_say(text, params, output_path)
-        elif self.backend == "pyttsx3":
+        elif backend == "pyttsx3":
             return self._synthesize_pyttsx3(text, params, output_path)
-        elif self.backend == "gtts":
+        elif backend == "gtts":
             return self._synthesize_gtts(text, params, output_path)
         else:
-            raise ValueError(f"Unknown TTS backend: {self.backend}")
+            raise ValueError(f"Unknown TTS backend: {backend}")
 
     # ------------------------------------------------------------------
     # macOS 'say' backend  (most reliable on macOS)
@@ -88,7 +281,8 @@ class TTSEngine:
         """
         Use macOS native 'say' command.
         Supports: -r (rate in wpm), -o (output file), -v (voice)
-        Generates AIFF then converts to WAV for browser compatibility.
+        Generates AIFF then converts to WAV (with gain) for browser
+        compatibility.
         """
         # Ensure .wav extension for browser compatibility
         if output_path.endswith(".aiff"):
@@ -134,6 +328,29 @@ class TTSEngine:
         except FileNotFoundError:
             raise RuntimeError("macOS 'say' command not found. Use --engine pyttsx3 or --engine gtts.")
 
+        # Post-process volume if needed (map to dB change)
+        volume_db = 0.0
+        if abs(params.volume - 0.85) > 0.05:
+            volume_db = (params.volume - 0.85) * 30
+
+        # AIFF → WAV with gain in a single read/write pass
+        try:
+            _aiff_to_wav_soundfile(aiff_path, output_path, volume_db)
+            try:
+                os.remove(aiff_path)
+            except OSError:
+                pass
+        except (ImportError, RuntimeError):
+            # soundfile unavailable — fall back to afconvert + pydub
+            output_path = self._aiff_to_wav_afconvert(aiff_path, output_path, volume_db)
+
+        return os.path.abspath(output_path)
+
+    @staticmethod
+    def _aiff_to_wav_afconvert(
+        aiff_path: str, output_path: str, volume_db: float
+    ) -> str:
+        """Legacy conversion path; returns the path of the final audio file."""
         # Convert AIFF → WAV using macOS afconvert (built-in)
         try:
             convert_result = subprocess.run(
@@ -155,19 +372,17 @@ class TTSEngine:
             # afconvert not available — fallback to AIFF
             output_path = aiff_path
 
-        # Post-process volume with pydub if needed
-        if abs(params.volume - 0.85) > 0.05:
+        if volume_db:
             try:
                 from pydub import AudioSegment
                 audio = AudioSegment.from_file(output_path)
-                volume_db = (params.volume - 0.85) * 30  # map to dB change
                 audio = audio + volume_db
                 fmt = "wav" if output_path.endswith(".wav") else "aiff"
                 audio.export(output_path, format=fmt)
             except (ImportError, Exception):
                 pass  # Skip volume adjustment if pydub not available
 
-        return os.path.abspath(output_path)
+        return output_path
 
     # ------------------------------------------------------------------
     # pyttsx3 backend
@@ -176,43 +391,18 @@ class TTSEngine:
         self, text: str, params: VoiceParams, output_path: str
     ) -> str:
         """
-        Use pyttsx3 in a subprocess to avoid event loop hanging issues.
+        Use pyttsx3 in a persistent subprocess to avoid event loop hanging
+        issues without paying interpreter startup on every call.
         """
         if not output_path.endswith((".wav", ".mp3", ".aiff")):
             output_path += ".aiff"
 
         output_path = os.path.abspath(output_path)
 
-        # Run pyttsx3 in a subprocess to avoid macOS runLoop hang
-        script = f"""
-import pyttsx3
-import sys
-
-engine = pyttsx3.init()
-engine.setProperty('rate', {params.rate})
-engine.setProperty('volume', {params.volume})
-
-try:
-    voices = engine.getProperty('voices')
-    if voices:
-        engine.setProperty('voice', voices[0].id)
-except Exception:
-    pass
-
-engine.save_to_file({repr(text)}, {repr(output_path)})
-engine.runAndWait()
-engine.stop()
-sys.exit(0)
-"""
         try:
-            result = subprocess.run(
-                [sys.executable, "-c", script],
-                capture_output=True,
-                text=True,
-                timeout=30,
+            self._pyttsx3_worker.synthesize(
+                text, params.rate, params.volume, output_path, timeout=30
             )
-            if result.returncode != 0:
-                raise RuntimeError(f"pyttsx3 failed: {result.stderr}")
         except subprocess.TimeoutExpired:
             # Fallback to macos_say if on macOS
             if _is_macos():
@@ -222,7 +412,7 @@ sys.exit(0)
         return output_path
 
     # ------------------------------------------------------------------
-    # gTTS backend  (online, with pydub speed adjustment)
+    # gTTS backend  (online, with speed / volume post-processing)
     # ------------------------------------------------------------------
     def _synthesize_gtts(
         self, text: str, params: VoiceParams, output_path: str
@@ -237,28 +427,20 @@ sys.exit(0)
         tts = gTTS(text=text, lang="en", slow=False)
         tts.save(tmp_path)
 
-        # Post-process with pydub for speed / volume adjustment
-        try:
-            from pydub import AudioSegment
-
-            audio = AudioSegment.from_mp3(tmp_path)
-
-            # Speed adjustment: map rate (wpm) to a playback speed factor
-            baseline_rate = 200
-            speed_factor = params.rate / baseline_rate
-            speed_factor = max(0.5, min(2.0, speed_factor))
+        # Speed adjustment: map rate (wpm) to a playback speed factor
+        baseline_rate = 200
+        speed_factor = params.rate / baseline_rate
+        speed_factor = max(0.5, min(2.0, speed_factor))
 
-            if abs(speed_factor - 1.0) > 0.05:
-                new_frame_rate = int(audio.frame_rate * speed_factor)
-                audio = audio._spawn(audio.raw_data, overrides={
-                    "frame_rate": new_frame_rate
-                }).set_frame_rate(audio.frame_rate)
+        # Volume adjustment
+        volume_db = (params.volume - 0.85) * 20
 
-            # Volume adjustment
-            volume_db = (params.volume - 0.85) * 20
-            audio = audio + volume_db
-
-            audio.export(output_path, format="mp3")
+        try:
+            try:
+                _adjust_mp3_soundfile(tmp_path, output_path, speed_factor, volume_db)
+            except (ImportError, RuntimeError):
+                # soundfile/scipy missing, or libsndfile built without MP3
+                _adjust_mp3_pydub(tmp_path, output_path, speed_factor, volume_db)
         except ImportError:
             import shutil
             shutil.move(tmp_path, output_path)
@@ -270,3 +452,64 @@ sys.exit(0)
                     pass
 
         return os.path.abspath(output_path)
+
+
+# ---------------------------------------------------------------------------
+# Audio post-processing helpers
+# ---------------------------------------------------------------------------
+def _aiff_to_wav_soundfile(src_path: str, dst_path: str, volume_db: float) -> None:
+    """Read AIFF, apply gain (if any) and write 16-bit PCM WAV in one pass."""
+    import numpy as np
+    import soundfile as sf
+
+    data, sr = sf.read(src_path, dtype="float32")
+
+    if volume_db:
+        data *= 10 ** (volume_db / 20)
+        np.clip(data, -1.0, 1.0, out=data)
+
+    sf.write(dst_path, data, sr, format="WAV", subtype="PCM_16")
+
+
+def _adjust_mp3_soundfile(
+    src_path: str, dst_path: str, speed_factor: float, volume_db: float
+) -> None:
+    """
+    Single decode → polyphase resample → in-place gain → single encode.
+
+    Resampling to 1/speed_factor as many samples at the original rate is the
+    same "play it faster" effect as the old pydub frame-rate trick.
+    """
+    import numpy as np
+    import soundfile as sf
+    from scipy.signal import resample_poly
+
+    data, sr = sf.read(src_path, dtype="float32")
+
+    if abs(speed_factor - 1.0) > 0.05:
+        data = resample_poly(
+            data, up=1000, down=int(1000 * speed_factor), axis=0
+        ).astype(np.float32, copy=False)
+
+    data *= 10 ** (volume_db / 20)
+    np.clip(data, -1.0, 1.0, out=data)
+
+    sf.write(dst_path, data, sr, format="MP3")
+
+
+def _adjust_mp3_pydub(
+    src_path: str, dst_path: str, speed_factor: float, volume_db: float
+) -> None:
+    """Fallback when soundfile/scipy (or libsndfile MP3 support) is missing."""
+    from pydub import AudioSegment
+
+    audio = AudioSegment.from_mp3(src_path)
+
+    if abs(speed_factor - 1.0) > 0.05:
+        new_frame_rate = int(audio.frame_rate * speed_factor)
+        audio = audio._spawn(audio.raw_data, overrides={
+            "frame_rate": new_frame_rate
+        }).set_frame_rate(audio.frame_rate)
+
+    audio = audio + volume_db
+    audio.export(dst_path, format="mp3")
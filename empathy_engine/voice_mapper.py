@@ -6,6 +6,11 @@ with linear intensity scaling. Supports granular emotions.
 """
 
 from dataclasses import dataclass
+from typing import List, Sequence
+
+import numpy as np
+
+from empathy_engine._numba import njit
 
 
 @dataclass
@@ -54,6 +59,31 @@ EMOTION_PROFILE = {
     "calm":          ( -30,       0.90,       -0.10 ),
 }
 
+# Struct-of-arrays copy of EMOTION_PROFILE for the JIT / vectorised paths,
+# indexed by emotion id. float64 keeps results identical to the scalar math.
+EMOTION_IDS = {name: i for i, name in enumerate(EMOTION_PROFILE)}
+RATE_DELTAS = np.array([p[0] for p in EMOTION_PROFILE.values()], dtype=np.float64)
+PITCH_MULTS = np.array([p[1] for p in EMOTION_PROFILE.values()], dtype=np.float64)
+VOL_DELTAS  = np.array([p[2] for p in EMOTION_PROFILE.values()], dtype=np.float64)
+
+
+# Explicit signature → compiled (or loaded from the on-disk cache) at import
+# time, never lazily inside the first request.
+@njit(
+    "Tuple((int64, float64, float64))"
+    "(int64, float64, float64, float64, float64,"
+    " float64[::1], float64[::1], float64[::1])",
+    cache=True,
+)
+def _map_numba(emo_id, intensity, base_rate, base_pitch, base_vol,
+               rate_deltas, pitch_mults, vol_deltas):
+    """Clamp + linear interpolation; returns (rate, pitch, volume)."""
+    intensity = max(0.0, min(1.0, intensity))
+    rate = int(base_rate + rate_deltas[emo_id] * intensity)
+    pitch = base_pitch + (pitch_mults[emo_id] - base_pitch) * intensity
+    volume = max(0.1, min(1.0, base_vol + vol_deltas[emo_id] * intensity))
+    return rate, pitch, volume
+
 
 class VoiceMapper:
     """
@@ -73,24 +103,53 @@ class VoiceMapper:
         self.baseline_pitch = baseline_pitch
         self.baseline_volume = baseline_volume
 
+        self._emo_to_id = EMOTION_IDS
+        self._neutral_id = EMOTION_IDS["neutral"]
+
     def map(self, emotion: str, intensity: float) -> VoiceParams:
         """
         Return VoiceParams for the given *emotion* and *intensity* (0–1).
 
         Unknown emotions are treated as neutral.
         """
-        intensity = max(0.0, min(1.0, intensity))  # clamp
-        profile = EMOTION_PROFILE.get(emotion, EMOTION_PROFILE["neutral"])
-
-        rate_delta, pitch_mult, vol_delta = profile
-
-        # Linear interpolation from baseline to full profile
-        rate = int(self.baseline_rate + rate_delta * intensity)
-        pitch = self.baseline_pitch + (pitch_mult - self.baseline_pitch) * intensity
-        volume = max(0.1, min(1.0,
-                    self.baseline_volume + vol_delta * intensity))
-
-        return VoiceParams(rate=rate, pitch=pitch, volume=volume)
+        emo_id = self._emo_to_id.get(emotion, self._neutral_id)
+
+        # Clamp + linear interpolation from baseline to full profile
+        rate, pitch, volume = _map_numba(
+            emo_id,
+            float(intensity),
+            float(self.baseline_rate),
+            float(self.baseline_pitch),
+            float(self.baseline_volume),
+            RATE_DELTAS,
+            PITCH_MULTS,
+            VOL_DELTAS,
+        )
+
+        return VoiceParams(rate=int(rate), pitch=float(pitch), volume=float(volume))
+
+    def map_batch(
+        self, emotions: Sequence[str], intensities: Sequence[float]
+    ) -> List[VoiceParams]:
+        """
+        Vectorised :meth:`map` over parallel sequences of emotions and
+        intensities; returns one VoiceParams per pair.
+        """
+        idx = np.fromiter(
+            (self._emo_to_id.get(e, self._neutral_id) for e in emotions),
+            dtype=np.intp,
+            count=len(emotions),
+        )
+        intensities = np.clip(np.asarray(intensities, dtype=np.float64), 0.0, 1.0)
+
+        rates = (self.baseline_rate + RATE_DELTAS[idx] * intensities).astype(np.int64)
+        pitches = self.baseline_pitch + (PITCH_MULTS[idx] - self.baseline_pitch) * intensities
+        volumes = np.clip(self.baseline_volume + VOL_DELTAS[idx] * intensities, 0.1, 1.0)
+
+        return [
+            VoiceParams(rate=int(r), pitch=float(p), volume=float(v))
+            for r, p, v in zip(rates.tolist(), pitches.tolist(), volumes.tolist())
+        ]
 
     def explain(self, emotion: str, intensity: float) -> str:
         """Return a human-readable explanation of the mapping."""
@@ -8,33 +8,105 @@ Open: http://localhost:5000
 
 import os
 import sys
+import base64
+import mimetypes
 
 # Add project root to path so we can import empathy_engine
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, PROJECT_ROOT)
 
 from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from empathy_engine.engine import EmpathyEngine
 
+# Faster JSON (de)serialisation when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (used by jsonify / get_json)."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        # Hand dates and dataclasses to Flask's default() as well, so the
+        # output matches DefaultJSONProvider (HTTP dates, Decimal, __html__…)
+        option = (orjson.OPT_NON_STR_KEYS
+                  | orjson.OPT_PASSTHROUGH_DATETIME
+                  | orjson.OPT_PASSTHROUGH_DATACLASS)
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        default = kwargs.get("default", self.default)
+        return orjson.dumps(obj, default=default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # ---------------------------------------------------------------------------
 # App setup
 # ---------------------------------------------------------------------------
 app = Flask(__name__)
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
 
 # Output directory for generated audio
 AUDIO_DIR = os.path.join(PROJECT_ROOT, "output")
 os.makedirs(AUDIO_DIR, exist_ok=True)
 
-# Lazy-initialise engine (avoid slow startup on import)
+# Clips up to this size are also returned inline as a data: URL, so the
+# browser can play them without a second request to /audio/<filename>
+INLINE_AUDIO_MAX_BYTES = 200 * 1024
+
+# Concurrent HF calls arriving within this window share one forward pass
+HF_BATCH_WINDOW_MS = 8.0
+
+# Optional "short mode" for typical UI texts, e.g. EMPATHY_HF_STATIC_LENGTH=32
+HF_STATIC_LENGTH = int(os.environ.get("EMPATHY_HF_STATIC_LENGTH", "0")) or None
+
+# Engine singleton shared by every request thread in the worker (so their
+# HF calls can be micro-batched), built and warmed at worker boot by
+# warm_engine() below so the first request doesn't pay the model-load cost.
 _engine = None
+_engine_pid = None
 
 def get_engine():
-    global _engine
-    if _engine is None:
-        _engine = EmpathyEngine(tts_backend="auto", use_hf=True)
+    global _engine, _engine_pid
+    # ORT / OpenMP thread pools and the batch thread don't survive fork(),
+    # so a process forked after the engine was built (gunicorn --preload)
+    # builds its own rather than inheriting a broken one.
+    if _engine is None or _engine_pid != os.getpid():
+        _engine = EmpathyEngine(
+            tts_backend="auto",
+            use_hf=True,
+            hf_batch_window_ms=HF_BATCH_WINDOW_MS,
+            hf_static_length=HF_STATIC_LENGTH,
+        )
+        _engine_pid = os.getpid()
     return _engine
 
 
+def warm_engine():
+    """
+    Build the engine and exercise the hot paths once (HF inference, voice
+    mapping) so the first real request doesn't pay for loading or JIT.
+
+    Call this in the serving process. Under gunicorn --preload, the import-
+    time call runs in the master, so hook it into each worker too, e.g.
+    ``post_fork = lambda server, worker: app.warm_engine()``.
+    """
+    engine = get_engine()
+    if engine.detector.hf_classifier is not None:
+        # Bypass detect() so the warm-up text doesn't land in the result cache
+        engine.detector._hf_analyse("warmup")
+    engine.mapper.map("neutral", 0.0)
+    return engine
+
+
 # ---------------------------------------------------------------------------
 # Routes
 # ---------------------------------------------------------------------------
@@ -69,19 +141,38 @@ def synthesize():
     audio_filename = os.path.basename(result["audio"])
     result["audio_url"] = f"/audio/{audio_filename}"
 
+    try:
+        if os.path.getsize(result["audio"]) <= INLINE_AUDIO_MAX_BYTES:
+            with open(result["audio"], "rb") as fh:
+                encoded = base64.b64encode(fh.read()).decode("ascii")
+            mime = mimetypes.guess_type(audio_filename)[0] or "audio/wav"
+            result["audio_data"] = f"data:{mime};base64,{encoded}"
+    except OSError:
+        pass  # the player falls back to audio_url
+
     return jsonify(result)
 
 
 @app.route("/audio/<filename>")
 def serve_audio(filename):
-    """Serve generated audio files."""
-    return send_from_directory(AUDIO_DIR, filename)
+    """Serve generated audio files (supports Range / If-None-Match)."""
+    # File names are content-addressed, so browsers may cache them
+    return send_from_directory(
+        AUDIO_DIR, filename, conditional=True, etag=True, max_age=3600
+    )
 
 
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 if __name__ == "__main__":
-    print("\n🌐 Starting Empathy Engine Web Interface...")
-    print("   Open http://localhost:5001 in your browser\n")
+    # With the reloader on, only the serving child process needs the model
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        warm_engine()
+    else:
+        print("\n🌐 Starting Empathy Engine Web Interface...")
+        print("   Open http://localhost:5001 in your browser\n")
     app.run(debug=True, host="0.0.0.0", port=5001)
+else:
+    # Imported by a WSGI server (e.g. gunicorn): warm up at worker boot
+    warm_engine()